@@ -1,7 +1,11 @@
+import atexit
 import sqlite3
+from collections import OrderedDict
+from contextlib import contextmanager
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Union, Any
+from typing import Dict, Iterator, List, Optional, Tuple, Union, Any
 
 from rich.console import Console
 
@@ -11,18 +15,70 @@ from task_manager.models import Task
 console = Console()
 
 
+_connection: Optional[sqlite3.Connection] = None
+
+# Category name -> id, loaded on first use. Categories change rarely, so this
+# saves a lookup query on every add/update.
+_category_cache: Optional[Dict[str, int]] = None
+
+# Recently viewed tasks keyed by ID, most recently used last. Every write to a
+# task drops its entry so reads never see stale data.
+_TASK_CACHE_SIZE = 128
+_task_cache: "OrderedDict[int, Dict[str, Any]]" = OrderedDict()
+
+# Hot statements are kept as constants so every call sends the same SQL text
+# and hits the connection's prepared statement cache instead of re-parsing.
+_SQL_GET_TASK = """
+SELECT
+    t.id, t.title, t.description, t.due_date, t.status, t.priority,
+    c.name as category, c.color as category_color
+FROM tasks t
+LEFT JOIN categories c ON t.category_id = c.id
+WHERE t.id = ?
+"""
+
+_SQL_GET_TAGS_FOR_TASK = """
+SELECT tg.name
+FROM tags tg
+JOIN task_tags tt ON tg.id = tt.tag_id
+WHERE tt.task_id = ?
+"""
+
+_SQL_DELETE_TASK = "DELETE FROM tasks WHERE id = ?"
+
+_UPDATABLE_COLUMNS = frozenset({
+    "title", "description", "due_date", "status", "priority", "category_id",
+    "updated_at",
+})
+
+
 def get_db_connection() -> sqlite3.Connection:
-    """Creates and returns a database connection with proper configuration.
+    """Returns the shared database connection, creating it on first use.
+
+    The connection is kept open for the lifetime of the process so SQLite can
+    reuse its page cache between calls, and is closed automatically at exit.
 
     Returns:
         sqlite3.Connection: A configured SQLite database connection with:
+            - Autocommit mode; multi-statement writes use _write_transaction
+            - WAL journaling with synchronous=NORMAL
+            - In-memory temp storage, a 64MB page cache and memory-mapped I/O
             - Foreign key constraints enabled
             - Row factory set to sqlite3.Row
     """
-    conn = sqlite3.connect(config.DB_FULL_PATH)
-    conn.execute("PRAGMA foreign_keys = ON")
-    conn.row_factory = sqlite3.Row
-    return conn
+    global _connection
+    if _connection is None:
+        conn = sqlite3.connect(config.DB_FULL_PATH, isolation_level=None)
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        conn.execute("PRAGMA cache_size = -64000")
+        conn.execute("PRAGMA mmap_size = 268435456")
+        conn.execute("PRAGMA foreign_keys = ON")
+        conn.row_factory = sqlite3.Row
+        atexit.register(conn.close)
+        _connection = conn
+    return _connection
 
 
 def init_db() -> None:
@@ -31,68 +87,253 @@ def init_db() -> None:
     Creates the following tables if they don't exist:
         - categories: Stores task categories with colors
         - tasks: Main tasks table with foreign key to categories
+        - tasks_fts: Full-text index over task titles and descriptions
         - tags: Stores available tags
         - task_tags: Junction table for many-to-many relationship between tasks and tags
 
-    Also populates default categories with predefined colors.
+    Also creates indexes for the common listing filters and sort order,
+    populates default categories with predefined colors and refreshes the
+    query planner statistics.
     """
     conn = get_db_connection()
-    cursor = conn.cursor()
-
-    conn.execute("""
-    Create TABLE IF NOT EXISTS categories (
-                 id INTEGER PRIMARY KEY, 
-                 name TEXT NOT NULL UNIQUE, 
-                 color TEXT DEFAULT 'white',
-                 created_at TEXT DEFAULT CURRENT_TIMESTAMP)
-    """)
+    with _write_transaction(conn) as cursor:
+        cursor.execute("""
+        Create TABLE IF NOT EXISTS categories (
+                     id INTEGER PRIMARY KEY, 
+                     name TEXT NOT NULL UNIQUE, 
+                     color TEXT DEFAULT 'white',
+                     created_at TEXT DEFAULT CURRENT_TIMESTAMP)
+        """)
 
-    conn.execute("""
-    CREATE TABLE IF NOT EXISTS tasks (
-                 id INTEGER PRIMARY KEY,
-                 title TEXT NOT NULL,
-                 description TEXT, 
-                 created_at TEXT DEFAULT CURRENT_TIMESTAMP,
-                 updated_at TEXT DEFAULT CURRENT_TIMESTAMP,
-                 status TEXT DEFAULT 'pending',
-                 priority TEXT DEFAULT 'medium',
-                 category_id INTEGER, 
-                 FOREIGN KEY (category_id) REFERENCES categories (id) ON DELETE SET NULL)
-    """)
+        cursor.execute("""
+        CREATE TABLE IF NOT EXISTS tasks (
+                     id INTEGER PRIMARY KEY,
+                     title TEXT NOT NULL,
+                     description TEXT, 
+                     due_date TEXT,
+                     created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                     updated_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                     status TEXT DEFAULT 'pending',
+                     priority TEXT DEFAULT 'medium',
+                     category_id INTEGER, 
+                     FOREIGN KEY (category_id) REFERENCES categories (id) ON DELETE SET NULL)
+        """)
+
+        task_columns = [row['name']
+                        for row in cursor.execute("PRAGMA table_info(tasks)")]
+        if "due_date" not in task_columns:
+            cursor.execute("ALTER TABLE tasks ADD COLUMN due_date TEXT")
+
+        fts_exists = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'tasks_fts'"
+        ).fetchone()
 
-    cursor.execute("""
-    CREATE TABLE IF NOT EXISTS tags(
-                   id INTEGER PRIMARY KEY, 
-                   name TEXT NOT NULL UNIQUE, 
-                   created_at TEXT DEFAULT CURRENT_TIMESTAMP)
-    """)
+        cursor.execute("""
+        CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(
+                       title, description,
+                       content='tasks', content_rowid='id', tokenize='unicode61')
+        """)
 
-    cursor.execute("""
-    CREATE TABLE IF NOT EXISTS task_tags (
-                   task_id INTEGER,
-                   tag_id INTEGER, 
-                   PRIMARY KEY (task_id, tag_id),
-                   FOREIGN KEY (task_id) REFERENCES tasks (id) ON DELETE CASCADE,
-                   FOREIGN KEY (tag_id) REFERENCES tags (id) ON DELETE CASCADE) 
-    """)
+        # Triggers are created one by one because executescript() would
+        # commit the surrounding transaction
+        cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS tasks_fts_ai AFTER INSERT ON tasks BEGIN
+            INSERT INTO tasks_fts (rowid, title, description)
+            VALUES (new.id, new.title, new.description);
+        END
+        """)
+        cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS tasks_fts_ad AFTER DELETE ON tasks BEGIN
+            INSERT INTO tasks_fts (tasks_fts, rowid, title, description)
+            VALUES ('delete', old.id, old.title, old.description);
+        END
+        """)
+        cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS tasks_fts_au
+        AFTER UPDATE OF title, description ON tasks BEGIN
+            INSERT INTO tasks_fts (tasks_fts, rowid, title, description)
+            VALUES ('delete', old.id, old.title, old.description);
+            INSERT INTO tasks_fts (rowid, title, description)
+            VALUES (new.id, new.title, new.description);
+        END
+        """)
+
+        if not fts_exists:
+            # Index any tasks that were created before the search table existed
+            cursor.execute("INSERT INTO tasks_fts (tasks_fts) VALUES ('rebuild')")
 
-    default_categories = [
-        ("Work", "blue"),
-        ("Personal", "green"),
-        ("Health", "red"),
-        ("Finance", "yellow"),
-        ("Education", "cyan"),
-    ]
-    for category, color in default_categories:
         cursor.execute("""
-            INSERT INTO categories (name, color) VALUES (?,?) ON CONFLICT(name) DO NOTHING""", (category, color))
+        CREATE TABLE IF NOT EXISTS tags(
+                       id INTEGER PRIMARY KEY, 
+                       name TEXT NOT NULL UNIQUE, 
+                       created_at TEXT DEFAULT CURRENT_TIMESTAMP)
+        """)
 
-    conn.commit()
-    conn.close()
+        cursor.execute("""
+        CREATE TABLE IF NOT EXISTS task_tags (
+                       task_id INTEGER,
+                       tag_id INTEGER, 
+                       PRIMARY KEY (task_id, tag_id),
+                       FOREIGN KEY (task_id) REFERENCES tasks (id) ON DELETE CASCADE,
+                       FOREIGN KEY (tag_id) REFERENCES tags (id) ON DELETE CASCADE) 
+        """)
+
+        indexes = [
+            "CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks (status)",
+            "CREATE INDEX IF NOT EXISTS idx_tasks_priority ON tasks (priority)",
+            "CREATE INDEX IF NOT EXISTS idx_tasks_category ON tasks (category_id)",
+            "CREATE INDEX IF NOT EXISTS idx_tasks_order "
+            "ON tasks (due_date, priority DESC, id DESC)",
+            "CREATE INDEX IF NOT EXISTS idx_task_tags_tag ON task_tags (tag_id, task_id)",
+        ]
+        for index in indexes:
+            cursor.execute(index)
+
+        default_categories = [
+            ("Work", "blue"),
+            ("Personal", "green"),
+            ("Health", "red"),
+            ("Finance", "yellow"),
+            ("Education", "cyan"),
+        ]
+        cursor.executemany("""
+            INSERT INTO categories (name, color) VALUES (?,?) ON CONFLICT(name) DO NOTHING""",
+            default_categories)
+
+        cursor.execute("ANALYZE")
     console.print(
         "[bold green]Database initialized successfully![/bold green]")
 
 
+class _TaskNotFound(Exception):
+    """Raised inside a write transaction to abort it when the task is missing."""
+
+
+@contextmanager
+def _write_transaction(conn: sqlite3.Connection) -> Iterator[sqlite3.Cursor]:
+    """Runs a block of writes as one transaction holding the write lock.
+
+    Commits when the block exits normally and rolls back if it raises.
+
+    Args:
+        conn (sqlite3.Connection): The connection to run the transaction on
+
+    Yields:
+        sqlite3.Cursor: Cursor to execute the transaction's statements with
+    """
+    global _category_cache
+    cursor = conn.cursor()
+    cursor.execute("BEGIN IMMEDIATE")
+    try:
+        yield cursor
+    except BaseException:
+        cursor.execute("ROLLBACK")
+        # Categories inserted during the transaction no longer exist
+        _category_cache = None
+        raise
+    cursor.execute("COMMIT")
+
+
+def _invalidate_task(task_id: int) -> None:
+    """Drops a task from the get_task cache after it has been written to.
+
+    Args:
+        task_id (int): The ID of the task that changed
+    """
+    _task_cache.pop(task_id, None)
+
+
+@lru_cache(maxsize=64)
+def _update_sql(columns: Tuple[str, ...]) -> str:
+    """Builds the UPDATE statement for a given set of task columns.
+
+    Column names can't be bound as parameters, so they are checked against
+    the columns update_tasks is allowed to write before being interpolated.
+
+    Args:
+        columns (Tuple[str, ...]): Sorted names of the columns to update
+
+    Returns:
+        str: An UPDATE statement taking the column values followed by the task ID
+
+    Raises:
+        ValueError: If any column is not an updatable task column
+    """
+    invalid = set(columns) - _UPDATABLE_COLUMNS
+    if invalid:
+        raise ValueError(
+            f"Cannot update unknown task fields: {', '.join(sorted(invalid))}")
+
+    assignments = ", ".join(f"{column} = ?" for column in columns)
+    return f"UPDATE tasks SET {assignments} WHERE id = ?"
+
+
+def _get_category_id(cursor: sqlite3.Cursor, name: str) -> int:
+    """Returns the ID of the named category, creating it if it doesn't exist.
+
+    Args:
+        cursor (sqlite3.Cursor): Cursor of the connection running the write
+        name (str): The category name to look up
+
+    Returns:
+        int: The ID of the existing or newly created category
+    """
+    global _category_cache
+    if _category_cache is None:
+        cursor.execute("SELECT id, name FROM categories")
+        _category_cache = {row['name']: row['id'] for row in cursor.fetchall()}
+
+    category_id = _category_cache.get(name)
+    if category_id is None:
+        # Another connection may have created the category since the cache
+        # was loaded, so don't assume the INSERT added a row
+        cursor.execute(
+            "INSERT INTO categories (name) VALUES (?) ON CONFLICT(name) DO NOTHING",
+            (name,))
+        cursor.execute("SELECT id FROM categories WHERE name = ?", (name,))
+        category_id = cursor.fetchone()['id']
+        _category_cache[name] = category_id
+    return category_id
+
+
+def _get_tag_ids(cursor: sqlite3.Cursor, tags: List[str]) -> List[int]:
+    """Returns the IDs of the given tags, creating any that don't exist yet.
+
+    Args:
+        cursor (sqlite3.Cursor): Cursor of the connection running the write
+        tags (List[str]): Tag names to look up
+
+    Returns:
+        List[int]: Tag IDs in the order the names first appear in tags
+    """
+    tag_names = list(dict.fromkeys(tags))
+    if not tag_names:
+        return []
+
+    cursor.executemany(
+        "INSERT INTO tags (name) VALUES (?) ON CONFLICT(name) DO NOTHING",
+        [(name,) for name in tag_names])
+
+    placeholders = ", ".join("?" * len(tag_names))
+    cursor.execute(
+        f"SELECT id, name FROM tags WHERE name IN ({placeholders})", tag_names)
+    name_to_id = {row['name']: row['id'] for row in cursor.fetchall()}
+    return [name_to_id[name] for name in tag_names]
+
+
+def _link_task_tags(cursor: sqlite3.Cursor, task_id: int, tag_ids: List[int]) -> None:
+    """Attaches the given tags to a task.
+
+    Args:
+        cursor (sqlite3.Cursor): Cursor of the connection running the write
+        task_id (int): The ID of the task to link the tags to
+        tag_ids (List[int]): IDs of the tags to attach
+    """
+    cursor.executemany(
+        "INSERT OR IGNORE INTO task_tags (task_id, tag_id) VALUES (?, ?)",
+        [(task_id, tag_id) for tag_id in tag_ids])
+
+
 def add_task(task: Task) -> int:
     """Adds a new task to the database.
 
@@ -110,46 +351,28 @@ def add_task(task: Task) -> int:
         int: The ID of the newly created task
     """
     conn = get_db_connection()
-    cursor = conn.cursor()
-
-    category_id = None
-    if task.category:
-        cursor.execute(
-            "SELECT id FROM categories WHERE name = ?" (task.category,))
-        result = cursor.fetchone()
-        if result:
-            category_id = result['id']
-        else:
-            cursor.execute(
-                "INSERT INTO categories (name) VALUES (?)", (task.category))
-            category_id = cursor.lastrowid
-    cursor.execute("""
-    INSERT INTO tasks (
-                   title, description, due_date, status, priority, category_id
-                   ) VALUES (?,?,?,?,?,?)
-    """, (
-        task.title,
-        task.description,
-        task.due_date.isoformat() if task.due_date else None,
-        task.status,
-        task.priority,
-        category_id
-    ))
-    task_id = cursor.lastrowid
-
-    if task.tags:
-        for tag in task.tags:
-            cursor.execute(
-                "INSERT INTO tags (name) VALUES (?) ON CONFLICT(name) DO NOTHING", (tag,))
-
-            cursor.execute("SELECT id FROM tags WHERE name = ?", (tag,))
-            tag_id = cursor.fetchone()['id']
-
-            cursor.execute(
-                "INSERT INTO task_tags (task_id, tag_id) VALUES (?,?)", (task_id, tag_id))
-    conn.commit()
-    conn.close()
-
+    with _write_transaction(conn) as cursor:
+        category_id = None
+        if task.category:
+            category_id = _get_category_id(cursor, task.category)
+        cursor.execute("""
+        INSERT INTO tasks (
+                       title, description, due_date, status, priority, category_id
+                       ) VALUES (?,?,?,?,?,?)
+        """, (
+            task.title,
+            task.description,
+            task.due_date.isoformat() if task.due_date else None,
+            task.status,
+            task.priority,
+            category_id
+        ))
+        task_id = cursor.lastrowid
+
+        if task.tags:
+            _link_task_tags(cursor, task_id, _get_tag_ids(cursor, task.tags))
+
+    _invalidate_task(task_id)
     return task_id
 
 
@@ -192,7 +415,11 @@ def get_tasks(
     SELECT 
              t.id, t.title, t.description, t.due_date, t.created_at, 
              t.updated_at, t.status, t.priority, 
-             c.name as category, c.color as category_color
+             c.name as category, c.color as category_color,
+             (SELECT GROUP_CONCAT(tg2.name, char(31))
+              FROM task_tags tt2
+              JOIN tags tg2 ON tg2.id = tt2.tag_id
+              WHERE tt2.task_id = t.id) as tag_csv
     FROM tasks t
     LEFT JOIN categories c on t.category_id = c.id
     """)
@@ -200,12 +427,18 @@ def get_tasks(
     params = []
     where_clauses = []
 
-    if tag:
+    if search:
         query += """
-    JOIN task_tags tt on t.id = tt.task_id
-    JOIN tags tg ON tt.tag_id = tg.id
+    JOIN tasks_fts ON tasks_fts.rowid = t.id
     """
 
+    if tag:
+        where_clauses.append("""t.id IN (
+        SELECT tt.task_id FROM task_tags tt
+        JOIN tags tg ON tg.id = tt.tag_id
+        WHERE tg.name = ?)""")
+        params.append(tag)
+
     if status:
         where_clauses.append("t.status = ?")
         params.append(status)
@@ -219,9 +452,10 @@ def get_tasks(
         params.append(category)
 
     if search:
-        where_clauses.append("(t.title LIKE ? OR t.description LIKE ?)")
-        search_term = f"%{search}%"
-        params.extend([search_term, search_term])
+        # Quote the term so FTS5 operators like '-' or '"' are matched literally
+        where_clauses.append("tasks_fts MATCH ?")
+        search_term = '"' + search.replace('"', '""') + '"*'
+        params.append(search_term)
 
     if where_clauses:
         query += " WHERE " + " AND ".join(where_clauses)
@@ -229,18 +463,20 @@ def get_tasks(
     query += " ORDER BY t.due_date ASC, t.priority DESC, t.id DESC LIMIT ?"
     params.append(limit)
     cursor.execute(query, params)
-    tasks = [dict(row) for row in cursor.fetchall()]
 
-    for task in tasks:
-        cursor.execute("""
-                       SELECT tg.name 
-                       FROM tags tg 
-                       JOIN task_tags tt ON tg.id = tt.tag_id
-                       WHERE tt.task_id = ?
-    """, ([task['id']],))
-        task['tags'] = [row['name'] for row in cursor.fetchall()]
-    conn.close()
-    return tasks
+    # Build each task dict straight from the raw row instead of copying a
+    # sqlite3.Row. Tags come back as one column joined by the ASCII unit
+    # separator, which can't clash with commas in free-text tag names.
+    columns = [column[0] for column in cursor.description[:-1]]
+
+    def task_factory(_cursor: sqlite3.Cursor, row: Tuple[Any, ...]) -> Dict[str, Any]:
+        task = dict(zip(columns, row))
+        tag_csv = row[-1]
+        task['tags'] = tag_csv.split('\x1f') if tag_csv else []
+        return task
+
+    cursor.row_factory = task_factory
+    return cursor.fetchall()
 
 
 def get_task(task_id: int) -> Optional[Dict[str, Any]]:
@@ -261,31 +497,23 @@ def get_task(task_id: int) -> Optional[Dict[str, Any]]:
             - category_color: Category color
             - tags: List of associated tags
     """
+    cached = _task_cache.get(task_id)
+    if cached is not None:
+        _task_cache.move_to_end(task_id)
+        return {**cached, 'tags': list(cached['tags'])}
+
     conn = get_db_connection()
-    cursor = conn.cursor()
-    cursor.execute("""
-                SELECT 
-                    t.id, t.title, t.description, t.due_date, t.status, t.priority,
-                    c.name as category, c.color as category_color
-                    FROM tasks t
-                    LEFT JOIN categories c ON t.category_id = c.id
-                    WHERE t.id = ?
-    """, (task_id, ))
-    task = cursor.fetchone()
+    task = conn.execute(_SQL_GET_TASK, (task_id,)).fetchone()
     if not task:
-        conn.close()
         return None
 
     task_dict = dict(task)
-    cursor.execute("""
-    SELECT tg.name
-    FROM tags tg 
-    JOIN task_tags tt ON tg.id = tt.tag_id
-    WHERE tt.task_id = ?
-    """, (task_id,))
-    task_dict['tags'] = [row['name'] for row in cursor.fetchall()]
-
-    conn.close()
+    tag_rows = conn.execute(_SQL_GET_TAGS_FOR_TASK, (task_id,)).fetchall()
+    task_dict['tags'] = [row['name'] for row in tag_rows]
+
+    _task_cache[task_id] = {**task_dict, 'tags': list(task_dict['tags'])}
+    if len(_task_cache) > _TASK_CACHE_SIZE:
+        _task_cache.popitem(last=False)
     return task_dict
 
 
@@ -299,16 +527,11 @@ def delete_task(task_id: int) -> bool:
         bool: True if task was deleted, False if task not found
     """
     conn = get_db_connection()
-    cursor = conn.cursor()
-    cursor.execute("SELECT id FROM tasks WHERE id = ?", (task_id,))
-    if not cursor.fetchone():
-        conn.close()
+    cursor = conn.execute(_SQL_DELETE_TASK, (task_id,))
+    if cursor.rowcount == 0:
         return False
 
-    cursor.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
-
-    conn.commit()
-    conn.close()
+    _invalidate_task(task_id)
     return True
 
 
@@ -329,59 +552,57 @@ def update_tasks(task_id: int, task_data: Dict[str, Any]) -> bool:
     Returns:
         bool: True if task was updated, False if task not found
 
+    Raises:
+        ValueError: If task_data contains a field that isn't a task column
+
     Note:
         - If category doesn't exist, it will be created
         - Existing tags will be removed and replaced with new tags
         - updated_at timestamp is automatically set to current time
     """
     conn = get_db_connection()
-    cursor = conn.cursor()
-
-    cursor.execute("SELECT if FROM TASKS WHERE id = ?", (task_id,))
-    if not cursor.fetchone():
-        conn.close()
-        return False
-
-    if "category" in task_data:
-        category_name = task_data.pop("category", None)
-        if category_name:
-            cursor.execute(
-                "SELECT if FROM categories WHERE name = ?", (category_name,))
-            result = cursor.fetchone()
-            if result:
-                task_data["category_id"] = result["id"]
-            else:
+    try:
+        with _write_transaction(conn) as cursor:
+            if "category" in task_data:
+                category_name = task_data.pop("category", None)
+                if category_name:
+                    task_data["category_id"] = _get_category_id(cursor, category_name)
+                else:
+                    task_data['category_id'] = None
+
+            tags = task_data.pop('tags', None)
+            if "due_date" in task_data and isinstance(task_data['due_date'], datetime):
+                task_data['due_date'] = task_data['due_date'].isoformat()
+
+            # Always run the UPDATE so its rowcount tells us whether the task exists
+            task_data["updated_at"] = datetime.now().isoformat()
+
+            columns = tuple(sorted(task_data))
+            values = [task_data[column] for column in columns]
+            values.append(task_id)
+            cursor.execute(_update_sql(columns), values)
+            if cursor.rowcount == 0:
+                # Raise rather than return so categories created above roll back
+                raise _TaskNotFound(task_id)
+
+            if tags is not None:
+                # Only write the difference so unchanged tags cost no writes
+                new_ids = _get_tag_ids(cursor, tags)
                 cursor.execute(
-                    "INSERT INTO categories (name) VALUES (?)", (category_name,))
-                task_data["category_id"] = cursor.lastrowid
-    else:
-        task_data['category_id'] = None
-
-    tags = task_data.pop('tags', None)
-    if "due_date" in task_data and isinstance(task_data['due_date'], datetime):
-        task_data['due_date'] = task_data['due_date'].isoformat()
-
-    if task_data:
-        task_data["updated_at"] = datetime.now().isoformat()
+                    "SELECT tag_id FROM task_tags WHERE task_id = ?", (task_id,))
+                old_ids = {row['tag_id'] for row in cursor.fetchall()}
+
+                to_remove = old_ids.difference(new_ids)
+                if to_remove:
+                    cursor.executemany(
+                        "DELETE FROM task_tags WHERE task_id = ? AND tag_id = ?",
+                        [(task_id, tag_id) for tag_id in to_remove])
+
+                to_add = [tag_id for tag_id in new_ids if tag_id not in old_ids]
+                if to_add:
+                    _link_task_tags(cursor, task_id, to_add)
+    except _TaskNotFound:
+        return False
 
-        placeholders = ", ".join([f"field = ?" for field in task_data.keys()])
-        values = list(task_data.values())
-        values.append(task_id)
-        cursor.execute(
-            f"UPDATE tasks SET {placeholders} WHERE id = ?", values)
-
-    if tags is not None:
-        cursor.execute("DELETE FROM task_tags WHERE task_id = ?", (task_id,))
-
-        for tag_name in tags:
-            cursor.execute(
-                "INSERT INTO tags (name) VALUES (?) ON CONFLICT(name) DO NOTHING", (tag_name,)
-            )
-            cursor.execute("SELECT id FROM tags WHERE name = ?", (tag_name,))
-            tag_id = cursor.fetchone()["id"]
-            cursor.execute(
-                "INSERT INTO task_tags (task_id, tag_id) VALUES (?, ?)",
-                (task_id, tag_id))
-    conn.commit()
-    conn.close()
+    _invalidate_task(task_id)
     return True